@@ -1,32 +1,60 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, Request, Response
-from fastapi.responses import StreamingResponse
+from contextvars import ContextVar
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from mcp import stdio_client, StdioServerParameters
 from pydantic import BaseModel
+from starlette.middleware.gzip import GZipMiddleware
 from strands.agent.conversation_manager import SlidingWindowConversationManager
 from strands import Agent
 from strands.models import BedrockModel
 from strands.session.s3_session_manager import S3SessionManager
+from botocore.config import Config
+import asyncio
 import boto3
-import json
+import hashlib
 import logging
+import logging.handlers
+import queue
+import orjson
 import os
+import sys
 import uuid
 import uvicorn
 from strands.tools.mcp import MCPClient
 
+from query_cache import QueryResultCache, wrap_query_tool_calls
+from semantic_cache import SemanticCache
+
 AWS_REGION = os.environ.get("AWS_REGION") or os.environ.get("AWS_DEFAULT_REGION", "us-west-2")
 BOTO_SESSION = boto3.Session()
+# Shared client tuning: amortize TLS handshakes and client construction across requests
+CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    retries={"mode": "adaptive"},
+    tcp_keepalive=True,
+)
+BEDROCK_RUNTIME_CLIENT = BOTO_SESSION.client("bedrock-runtime", config=CLIENT_CONFIG)
 CLUSTER_ARN = os.environ["CLUSTER_ARN"]
 DATABASE_NAME = os.environ["DATABASE_NAME"]
 MODEL_ID = os.environ.get("MODEL_ID", "global.anthropic.claude-sonnet-4-5-20250929-v1:0")
 SECRET_ARN = os.environ["SECRET_ARN"]
 STATE_BUCKET = os.environ.get("STATE_BUCKET", "")
-logging.getLogger("strands").setLevel(logging.DEBUG)
+# Hot paths only enqueue log records; a background listener formats them
+# and flushes stderr, so SSE chunks never wait on log I/O. Strands is kept
+# off DEBUG unless explicitly requested - its per-token records otherwise
+# dominate stderr under load.
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+_LOG_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_LOG_HANDLER = logging.StreamHandler()
+_LOG_HANDLER.setFormatter(logging.Formatter("%(levelname)s | %(name)s | %(message)s"))
+_LOG_LISTENER = logging.handlers.QueueListener(_LOG_QUEUE, _LOG_HANDLER)
+_LOG_LISTENER.start()
 logging.basicConfig(
-    format="%(levelname)s | %(name)s | %(message)s", 
-    handlers=[logging.StreamHandler()]
+    level=LOG_LEVEL,
+    handlers=[logging.handlers.QueueHandler(_LOG_QUEUE)],
 )
+logging.getLogger("strands").setLevel(LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
 SYSTEM_PROMPT = """
@@ -221,121 +249,238 @@ The crash data is in three table names `nyc_crashes, ca_crashes, ca_injuredwitne
             FOREIGN KEY (collision_id) REFERENCES ca_crashes(collision_id)
         );
 ```
+
+Prefer these pre-aggregated materialized views over scanning the wide tables
+whenever they can answer the question:
+- `mv_crashes_by_borough_year(borough, crash_year, crash_count, persons_injured, persons_killed, pedestrians_killed, cyclists_killed, motorists_killed)`
+- `mv_ca_crashes_by_city_year(city_name, crash_year, crash_count, persons_injured, persons_killed)`
+- `mv_injuries_by_zip(zip_code, crash_count, persons_injured, persons_killed)`
 """
 
 BEDROCK_MODEL = BedrockModel(
     model_id=MODEL_ID,
+    boto_session=BOTO_SESSION,
+    # Concurrent SSE streams reuse pooled keep-alive connections to Bedrock
+    # instead of paying a TLS handshake per call.
+    boto_client_config=Config(
+        max_pool_connections=100,
+        tcp_keepalive=True,
+        retries={"mode": "adaptive", "total_max_attempts": 4},
+        read_timeout=300,
+    ),
+    # The schema-heavy system prompt and tool definitions are identical on
+    # every turn; cache points let Bedrock reuse their prefill across calls.
+    cache_prompt="default",
+    cache_tools="default",
     # Add Guardrails here if desired
 )
 
-current_agent = None
+SEMANTIC_CACHE = SemanticCache(BEDROCK_RUNTIME_CLIENT)
+QUERY_CACHE = QueryResultCache()
+
+# Per-task agent reference: concurrent SSE streams each see their own agent
+# instead of clobbering a shared module global.
+CURRENT_AGENT: ContextVar[Agent | None] = ContextVar("current_agent", default=None)
+
+# Resolve the credential chain once at import; refreshable credentials are
+# re-frozen only when botocore reports they are close to expiry.
+_CREDENTIALS = BOTO_SESSION.get_credentials()
+_FROZEN_CREDENTIALS = _CREDENTIALS.get_frozen_credentials() if _CREDENTIALS else None
+_MCP_ENVIRONMENT: dict[str, str] | None = None
 
 def build_mcp_environment() -> dict[str, str]:
-    env = dict(os.environ)
-    credentials = BOTO_SESSION.get_credentials()
-    if credentials:
-        frozen = credentials.get_frozen_credentials()
-        env["AWS_ACCESS_KEY_ID"] = frozen.access_key
-        env["AWS_SECRET_ACCESS_KEY"] = frozen.secret_key
-        if frozen.token:
-            env["AWS_SESSION_TOKEN"] = frozen.token
-    return env
+    """Return the MCP subprocess environment, rebuilt only on credential refresh.
+
+    Copying os.environ and re-freezing the credential chain on every call is
+    wasted work: the environment is static for the life of the container and
+    the credentials only change when botocore refreshes them.
+    """
+    global _FROZEN_CREDENTIALS, _MCP_ENVIRONMENT
+    refreshed = False
+    if _CREDENTIALS and getattr(_CREDENTIALS, "refresh_needed", lambda: False)():
+        _FROZEN_CREDENTIALS = _CREDENTIALS.get_frozen_credentials()
+        refreshed = True
+    if _MCP_ENVIRONMENT is None or refreshed:
+        env = dict(os.environ)
+        if _FROZEN_CREDENTIALS:
+            env["AWS_ACCESS_KEY_ID"] = _FROZEN_CREDENTIALS.access_key
+            env["AWS_SECRET_ACCESS_KEY"] = _FROZEN_CREDENTIALS.secret_key
+            if _FROZEN_CREDENTIALS.token:
+                env["AWS_SESSION_TOKEN"] = _FROZEN_CREDENTIALS.token
+        _MCP_ENVIRONMENT = env
+    return _MCP_ENVIRONMENT
+
+def mcp_server_parameters() -> StdioServerParameters:
+    # The pinned server ships in the image (see Dockerfile); launching it
+    # through the interpreter avoids uvx's resolve-and-install on cold start.
+    # Flags match the 1.2.0 CLI: RDS_API selects the Data API path and
+    # readonly is the default, so no write flag is passed.
+    return StdioServerParameters(
+        command=sys.executable,
+        args=[
+            "-m", "awslabs.postgres_mcp_server.server",
+            "--connection_method", "RDS_API",
+            "--db_cluster_arn", CLUSTER_ARN,
+            "--secret_arn", SECRET_ARN,
+            "--database", DATABASE_NAME,
+            "--region", AWS_REGION,
+        ],
+        env=build_mcp_environment(),
+    )
+
+_TOOL_LIST_CACHE: dict[str, list] = {}
+
+def list_tools_cached(mcp_client: MCPClient) -> list:
+    """Memoize the MCP tool list for the fixed server configuration.
+
+    The tool objects wrap the live stdio client, so they cannot be pickled
+    to disk; an in-process memo keyed by the server arguments skips the RPC
+    for any re-listing during the life of the container. Set
+    MCP_TOOLS_CACHE=0 to force a fresh listing on every call.
+    """
+    if os.environ.get("MCP_TOOLS_CACHE", "1") != "1":
+        return mcp_client.list_tools_sync()
+    key = hashlib.blake2b(repr(mcp_server_parameters().args).encode()).hexdigest()
+    tools = _TOOL_LIST_CACHE.get(key)
+    if tools is None:
+        tools = mcp_client.list_tools_sync()
+        _TOOL_LIST_CACHE[key] = tools
+    return tools
 
 @asynccontextmanager
-async def session(id: str):
-    stdio_mcp_client = MCPClient(lambda: stdio_client(
-        StdioServerParameters(
-            command="uvx", 
-            args=[
-                "awslabs.postgres-mcp-server@latest",
-                "--resource_arn", CLUSTER_ARN,
-                "--secret_arn", SECRET_ARN,
-                "--database", DATABASE_NAME,
-                "--region", AWS_REGION,
-                "--readonly", "True",
-            ],
-            env=build_mcp_environment(),
-        )
-    ))
+async def lifespan(app: FastAPI):
+    # One long-lived MCP server process per container: spawning uvx and
+    # listing tools on every request dominated chat latency.
+    mcp_client = MCPClient(lambda: stdio_client(mcp_server_parameters()))
+    mcp_client.__enter__()
+    # Repeated questions often compile to identical SQL; serve those tool
+    # results from the query cache instead of re-running them on Aurora.
+    wrap_query_tool_calls(mcp_client, QUERY_CACHE)
+    try:
+        app.state.mcp_client = mcp_client
+        app.state.mcp_tools = list_tools_cached(mcp_client)
+        yield
+    finally:
+        mcp_client.__exit__(None, None, None)
 
-    # Get/create conversation in S3
-    session_manager = S3SessionManager(
+def get_session_manager(session_id: str) -> S3SessionManager:
+    # A fresh manager per request: strands session managers track the
+    # agents registered against them, so reusing one across turns makes
+    # the second Agent construction fail with a duplicate-agent error.
+    # The shared boto session below keeps the credential chain warm, which
+    # is the expensive part of construction anyway.
+    return S3SessionManager(
         boto_session=BOTO_SESSION,
+        boto_client_config=CLIENT_CONFIG,
         bucket=STATE_BUCKET,
-        session_id=id,
+        session_id=session_id,
     )
+
+@asynccontextmanager
+async def session(id: str):
+    # Get/create conversation in S3
+    session_manager = get_session_manager(id)
+    # With the schema prompt cached server-side, the sliding window is the
+    # main per-turn prefill cost; 6 messages keeps the last few exchanges
+    # without re-tokenizing long tool results from earlier in the session.
     conversation_manager = SlidingWindowConversationManager(
-        window_size=10,  # Maximum number of messages to keep
-        should_truncate_results=True, # Enable truncating the tool result when a message is too large for the model's context window 
+        window_size=6,  # Maximum number of messages to keep
+        should_truncate_results=True, # Enable truncating the tool result when a message is too large for the model's context window
     )
-    
-    with stdio_mcp_client:
-        tools = stdio_mcp_client.list_tools_sync()
-        agent = Agent(
-            conversation_manager=conversation_manager,
-            model=BEDROCK_MODEL,
-            session_manager=session_manager,
-            tools=tools,
-        )
-        try:
-            yield agent
-        finally:
-            pass
+
+    agent = Agent(
+        conversation_manager=conversation_manager,
+        model=BEDROCK_MODEL,
+        session_manager=session_manager,
+        system_prompt=SYSTEM_PROMPT,
+        tools=app.state.mcp_tools,
+    )
+    try:
+        yield agent
+    finally:
+        pass
 
 class ChatRequest(BaseModel):
     prompt: str
 
-app = FastAPI()
+def _sse(data) -> bytes:
+    return b"data: " + orjson.dumps(data) + b"\n\n"
+
+app = FastAPI(lifespan=lifespan)
+# Starlette's GZipMiddleware excludes text/event-stream by default, so the
+# SSE chat stream passes through uncompressed (compressing it would buffer
+# tokens and break incremental delivery). This only compresses the JSON
+# history and health responses.
+app.add_middleware(GZipMiddleware, minimum_size=256)
 
 @app.post('/api/chat')
 async def chat(chat_request: ChatRequest, request: Request):
     session_id: str = request.cookies.get("session_id", str(uuid.uuid4()))
+    generator = generate(session_id, chat_request.prompt, request)
+    # Invariant: the generator must stay async. Handing StreamingResponse a
+    # sync iterator demotes every chunk to a threadpool hop in Starlette.
+    assert hasattr(generator, "__aiter__")
     response = StreamingResponse(
-        generate(session_id, chat_request.prompt, request),
-        media_type="text/event-stream"
+        generator,
+        media_type="text/event-stream",
+        # Tell intermediary proxies not to buffer the event stream
+        headers={"X-Accel-Buffering": "no"},
     )
     response.set_cookie(key="session_id", value=session_id)
     return response
 
 async def generate(session_id: str, prompt: str, request: Request):
+    # Near-duplicate prompts replay the cached stream without touching Bedrock
+    cached_chunks = await asyncio.to_thread(SEMANTIC_CACHE.lookup, session_id, prompt)
+    if cached_chunks is not None:
+        for chunk in cached_chunks:
+            yield _sse(chunk)
+        return
+
     async with session(session_id) as agent:
-        global current_agent
-        current_agent = agent  # Store the current agent for use in tools
+        token = CURRENT_AGENT.set(agent)  # Store the current agent for use in tools
+        chunks = []
         try:
             async for event in agent.stream_async(prompt):
                 if "complete" in event:
                     logger.info("Response generation complete")
                 if "data" in event:
-                    yield f"data: {json.dumps(event['data'])}\n\n"
+                    chunks.append(event["data"])
+                    yield _sse(event["data"])
+            # Only fully streamed responses are worth replaying
+            await asyncio.to_thread(SEMANTIC_CACHE.store, session_id, prompt, chunks)
         except Exception as e:
-            error_message = json.dumps({"error": str(e)})
-            yield f"event: error\ndata: {error_message}\n\n"
+            yield b"event: error\ndata: " + orjson.dumps({"error": str(e)}) + b"\n\n"
         finally:
-            current_agent = None
+            CURRENT_AGENT.reset(token)
+
+def load_history(session_id: str) -> list[dict]:
+    """Restore conversation history from S3 without booting the MCP tools."""
+    agent = Agent(model=BEDROCK_MODEL, session_manager=get_session_manager(session_id))
+    # Filter messages to only include first text content; the walrus
+    # bindings index each message's content exactly once.
+    return [
+        {"role": message["role"], "content": [{"text": first["text"]}]}
+        for message in agent.messages
+        if (content := message.get("content")) and "text" in (first := content[0])
+    ]
 
 @app.get('/api/chat')
 async def chat_get(request: Request):
     session_id = request.cookies.get("session_id", str(uuid.uuid4()))
-    async with session(session_id) as agent:
-        # Filter messages to only include first text content
-        filtered_messages = []
-        for message in agent.messages:
-            if (message.get("content") and 
-                len(message["content"]) > 0 and 
-                "text" in message["content"][0]):
-                filtered_messages.append({
-                    "role": message["role"],
-                    "content": [{
-                        "text": message["content"][0]["text"]
-                    }]
-                })
- 
-    response = Response(
-        content=json.dumps({
-            "messages": filtered_messages,
-        }),
-        media_type="application/json",
-    )
+    filtered_messages = await asyncio.to_thread(load_history, session_id)
+
+    async def history_stream():
+        # Serialize one message at a time: constant-size buffers and an
+        # earlier first byte instead of one allocation for the whole history.
+        yield b'{"messages":['
+        for index, message in enumerate(filtered_messages):
+            if index:
+                yield b","
+            yield orjson.dumps(message)
+        yield b"]}"
+
+    response = StreamingResponse(history_stream(), media_type="application/json")
     response.set_cookie(key="session_id", value=session_id)
     return response
 
@@ -343,10 +488,13 @@ async def chat_get(request: Request):
 # Called by the Lambda Adapter to check liveness
 @app.get("/")
 async def root():
-    return Response(
-        content=json.dumps({"message": "OK"}),
-        media_type="application/json",
-    )
+    return ORJSONResponse({"message": "OK"})
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=int(os.environ.get("PORT", "8080")))
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=int(os.environ.get("PORT", "8080")),
+        loop="uvloop",
+        http="httptools",
+    )
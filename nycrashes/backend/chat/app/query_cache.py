@@ -0,0 +1,101 @@
+"""TTL cache for MCP database query results, keyed by normalized SQL.
+
+Distinct prompts frequently resolve to byte-identical SQL (monthly fatality
+counts, per-borough totals, ...), and the crash data only changes when the
+populator reloads it. Caching the tool result skips the Aurora Data API
+round-trip entirely on repeats.
+"""
+
+import hashlib
+import logging
+import re
+import time
+
+logger = logging.getLogger(__name__)
+
+CACHE_TTL_SECONDS = 3600
+MAX_ENTRIES = 256
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_sql(sql: str) -> str:
+    """Collapse whitespace and casing so trivial variants share a cache key."""
+    return _WHITESPACE.sub(" ", sql).strip().lower()
+
+
+def cache_key(sql: str) -> str:
+    return hashlib.sha256(normalize_sql(sql).encode()).hexdigest()
+
+
+class QueryResultCache:
+    """Bounded in-process cache of successful query tool results."""
+
+    def __init__(self, ttl_seconds: int = CACHE_TTL_SECONDS):
+        self._ttl_seconds = ttl_seconds
+        self._entries: dict[str, tuple[float, dict]] = {}
+
+    def get(self, sql: str) -> dict | None:
+        entry = self._entries.get(cache_key(sql))
+        if entry is None:
+            return None
+        expires_at, result = entry
+        if time.time() >= expires_at:
+            self._entries.pop(cache_key(sql), None)
+            return None
+        return result
+
+    def put(self, sql: str, result: dict) -> None:
+        if len(self._entries) >= MAX_ENTRIES:
+            oldest = min(self._entries, key=lambda key: self._entries[key][0])
+            del self._entries[oldest]
+        self._entries[cache_key(sql)] = (time.time() + self._ttl_seconds, result)
+
+
+def wrap_query_tool_calls(mcp_client, cache: QueryResultCache) -> None:
+    """Route SQL tool calls on the shared MCP client through the cache.
+
+    Patches both call_tool_async and call_tool_sync on the client instance;
+    the agent's streaming tool executor awaits the async path, so that is
+    the one that matters in practice, and the sync path is kept consistent
+    for direct callers. Cached results are re-stamped with the caller's
+    tool-use id so the agent can match them to its own request.
+    """
+    original_async = mcp_client.call_tool_async
+    original_sync = mcp_client.call_tool_sync
+
+    def _lookup(tool_use_id, name, arguments):
+        sql = (arguments or {}).get("sql")
+        if not sql:
+            return None, None
+        hit = cache.get(sql)
+        if hit is None:
+            return sql, None
+        logger.info("Query cache hit for tool %s", name)
+        result = dict(hit)
+        result["toolUseId"] = tool_use_id
+        return sql, result
+
+    def _store(sql, result):
+        if isinstance(result, dict) and result.get("status") == "success":
+            cache.put(sql, result)
+
+    async def cached_call_async(tool_use_id, name, arguments=None, *args, **kwargs):
+        sql, hit = _lookup(tool_use_id, name, arguments)
+        if hit is not None:
+            return hit
+        result = await original_async(tool_use_id, name, arguments, *args, **kwargs)
+        if sql:
+            _store(sql, result)
+        return result
+
+    def cached_call_sync(tool_use_id, name, arguments=None, *args, **kwargs):
+        sql, hit = _lookup(tool_use_id, name, arguments)
+        if hit is not None:
+            return hit
+        result = original_sync(tool_use_id, name, arguments, *args, **kwargs)
+        if sql:
+            _store(sql, result)
+        return result
+
+    mcp_client.call_tool_async = cached_call_async
+    mcp_client.call_tool_sync = cached_call_sync
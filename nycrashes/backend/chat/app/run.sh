@@ -14,4 +14,4 @@ else
     exit 127
 fi
 
-exec "${python_cmd}" -m uvicorn --port="${PORT}" main:app
+exec "${python_cmd}" -m uvicorn --port="${PORT}" --loop=uvloop --http=httptools main:app
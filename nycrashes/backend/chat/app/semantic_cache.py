@@ -0,0 +1,76 @@
+"""In-process semantic cache for streamed chat responses.
+
+Near-duplicate prompts ("fatal crashes in Brooklyn in 2023" vs "2023 Brooklyn
+fatal crashes") short-circuit to the previously streamed chunks instead of
+invoking the Bedrock agent again. Entries are scoped by session id so one
+user's cached answers are never replayed to another.
+"""
+
+import json
+import logging
+import math
+import os
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL_ID = os.environ.get("EMBEDDING_MODEL_ID", "amazon.titan-embed-text-v2:0")
+SIMILARITY_THRESHOLD = float(os.environ.get("SEMANTIC_CACHE_THRESHOLD", "0.9"))
+MAX_ENTRIES_PER_SESSION = int(os.environ.get("SEMANTIC_CACHE_MAX_ENTRIES", "128"))
+
+
+def _cosine_similarity(left: list[float], right: list[float]) -> float:
+    dot = sum(a * b for a, b in zip(left, right))
+    norm = math.sqrt(sum(a * a for a in left)) * math.sqrt(sum(b * b for b in right))
+    if norm == 0.0:
+        return 0.0
+    return dot / norm
+
+
+class SemanticCache:
+    """Cosine-similarity cache of streamed response chunks, keyed per session."""
+
+    def __init__(self, bedrock_client, threshold: float = SIMILARITY_THRESHOLD):
+        self._client = bedrock_client
+        self._threshold = threshold
+        # session_id -> list of (prompt embedding, streamed chunks)
+        self._entries: dict[str, list[tuple[list[float], list[str]]]] = {}
+
+    def lookup(self, session_id: str, prompt: str) -> list[str] | None:
+        """Return the cached chunks for the closest prior prompt, if similar enough."""
+        entries = self._entries.get(session_id)
+        if not entries:
+            return None
+        embedding = self._embed(prompt)
+        if embedding is None:
+            return None
+        best_similarity, best_chunks = max(
+            ((_cosine_similarity(embedding, stored), chunks) for stored, chunks in entries),
+            key=lambda pair: pair[0],
+        )
+        if best_similarity >= self._threshold:
+            logger.info("Semantic cache hit (similarity %.3f)", best_similarity)
+            return best_chunks
+        return None
+
+    def store(self, session_id: str, prompt: str, chunks: list[str]) -> None:
+        """Record the chunks streamed for a prompt so similar prompts can reuse them."""
+        if not chunks:
+            return
+        embedding = self._embed(prompt)
+        if embedding is None:
+            return
+        entries = self._entries.setdefault(session_id, [])
+        entries.append((embedding, chunks))
+        if len(entries) > MAX_ENTRIES_PER_SESSION:
+            del entries[0]
+
+    def _embed(self, text: str) -> list[float] | None:
+        try:
+            response = self._client.invoke_model(
+                modelId=EMBEDDING_MODEL_ID,
+                body=json.dumps({"inputText": text}),
+            )
+            return json.loads(response["body"].read())["embedding"]
+        except Exception as error:  # cache is best-effort; never fail the chat turn
+            logger.warning("Semantic cache embedding failed: %s", error)
+            return None
@@ -1,11 +1,12 @@
 from aws_cdk import Aws, BundlingOptions, CfnOutput, CustomResource, Duration, RemovalPolicy
 import aws_cdk.aws_ec2 as ec2
+import aws_cdk.aws_events as events
+import aws_cdk.aws_events_targets as targets
 import aws_cdk.aws_iam as iam
 import aws_cdk.aws_lambda as _lambda
 import aws_cdk.aws_logs as logs
 import aws_cdk.aws_rds as rds
 import aws_cdk.aws_s3 as s3
-import aws_cdk.aws_s3_deployment as s3deploy
 import aws_cdk.custom_resources as cr
 from constructs import Construct
 
@@ -27,7 +28,14 @@ class Backend(Construct):
             "DatabaseSecurityGroup",
             vpc=vpc,
             description="Security group for Aurora cluster",
-            allow_all_outbound=True,
+            allow_all_outbound=False,
+        )
+        # Aurora only dials out for aws_s3 imports (HTTPS via the S3
+        # gateway endpoint).
+        self.database_security_group.add_egress_rule(
+            peer=ec2.Peer.any_ipv4(),
+            connection=ec2.Port.tcp(443),
+            description="Allow HTTPS for S3 imports",
         )
 
         self.lambda_security_group = ec2.SecurityGroup(
@@ -35,7 +43,17 @@ class Backend(Construct):
             "PopulatorSecurityGroup",
             vpc=vpc,
             description="Security group for Lambda populator function",
-            allow_all_outbound=True,
+            allow_all_outbound=False,
+        )
+        self.lambda_security_group.add_egress_rule(
+            peer=ec2.Peer.any_ipv4(),
+            connection=ec2.Port.tcp(443),
+            description="Allow HTTPS to AWS APIs and VPC endpoints",
+        )
+        self.lambda_security_group.add_egress_rule(
+            peer=ec2.Peer.security_group_id(self.database_security_group.security_group_id),
+            connection=ec2.Port.tcp(5432),
+            description="Allow Postgres access to the Aurora security group",
         )
 
         self.database_security_group.add_ingress_rule(
@@ -62,6 +80,11 @@ class Backend(Construct):
         )
         self.source_bucket.grant_read(import_role)
 
+        # At the 0.5 ACU floor the first chat request after idle pays a
+        # multi-second capacity ramp, visible as tool-call timeouts. Deploys
+        # with '-c production=true' keep the cluster warm at 2 ACUs.
+        min_capacity = 2 if self.node.try_get_context("production") else 0.5
+
         self.cluster = rds.DatabaseCluster(
             self,
             "AuroraCluster",
@@ -78,9 +101,11 @@ class Backend(Construct):
             enable_data_api=True,
             vpc=vpc,
             security_groups=[self.database_security_group],
-            vpc_subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
-            serverless_v2_min_capacity=0.5,
-            serverless_v2_max_capacity=4,
+            vpc_subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED),
+            serverless_v2_min_capacity=min_capacity,
+            # Headroom for the populator's parallel CSV imports; idle cost
+            # is unchanged since serverless v2 only bills used capacity.
+            serverless_v2_max_capacity=8,
             s3_import_role=import_role,
             removal_policy=RemovalPolicy.DESTROY,
         )
@@ -99,8 +124,11 @@ class Backend(Construct):
                     command=[
                         "bash",
                         "-c",
-                        "pip install uv && "
-                        "uv export --frozen --no-dev --no-editable -o requirements.txt && "
+                        # requirements.txt is exported from uv.lock and kept
+                        # in the repo, so bundling no longer installs uv just
+                        # to regenerate it. Installing the pinned deps also
+                        # ships psycopg, which the runtime does not provide.
+                        "pip install -r requirements.txt --target /asset-output && "
                         "cp -r . /asset-output",
                     ],
                     user="root",
@@ -108,16 +136,18 @@ class Backend(Construct):
                 ),
             ),
             timeout=Duration.minutes(15),
-            memory_size=1024,
+            # 1769 MB is the first full-vCPU tier; billing scales with
+            # memory x duration, so faster runs keep cost roughly flat.
+            memory_size=1769,
             log_retention=logs.RetentionDays.ONE_MONTH,
             vpc=vpc,
             security_groups=[self.lambda_security_group],
-            vpc_subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_WITH_EGRESS),
+            vpc_subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED),
             environment={
                 "DATA_BUCKET": self.source_bucket.bucket_name,
                 "NYC_DATA_KEY": self.NYC_DATA_KEY,
                 "CA_DATA_KEYS": ",".join(self.CA_DATA_KEYS),
-                "CLUSTER_ARN": self.cluster.cluster_arn,
+                "CLUSTER_ENDPOINT": self.cluster.cluster_endpoint.hostname,
                 "SECRET_ARN": self.cluster.secret.secret_arn,
                 "DATABASE_NAME": self.DATABASE_NAME,
                 "CLUSTER_IDENTIFIER": self.cluster.cluster_identifier,
@@ -126,7 +156,6 @@ class Backend(Construct):
 
         self.source_bucket.grant_read_write(self.populator_function)
         self.cluster.secret.grant_read(self.populator_function)
-        self.cluster.grant_data_api_access(self.populator_function)
         self.cluster.connections.allow_default_port_from(self.populator_function)
 
         self.populator_function.add_to_role_policy(
@@ -155,6 +184,19 @@ class Backend(Construct):
         )
         self.database_populator.node.add_dependency(self.cluster)
 
+        events.Rule(
+            self,
+            "RefreshRollupsRule",
+            description="Nightly refresh of the crash rollup materialized views",
+            schedule=events.Schedule.rate(Duration.days(1)),
+            targets=[
+                targets.LambdaFunction(
+                    self.populator_function,
+                    event=events.RuleTargetInput.from_object({"mode": "refresh"}),
+                )
+            ],
+        )
+
         self.session_bucket = s3.Bucket(
             self,
             "ChatSessionBucket",
@@ -172,7 +214,7 @@ class Backend(Construct):
             "ChatFunction",
             code=chat_image_code,
             timeout=Duration.minutes(5),
-            memory_size=1024,
+            memory_size=1769,
             log_retention=logs.RetentionDays.ONE_MONTH,
             environment={
                 "AWS_LAMBDA_EXEC_WRAPPER": "/opt/bootstrap",
@@ -222,7 +264,21 @@ class Backend(Construct):
             )
         )
 
-        self.chat_function_url = self.chat_function.add_function_url(
+        # Container-image cold starts (image pull + runtime boot) are
+        # user-visible on the first streamed turn. Production deploys keep
+        # two warm environments via provisioned concurrency on the alias;
+        # SnapStart is not available for image-based functions.
+        self.chat_alias = _lambda.Alias(
+            self,
+            "ChatAlias",
+            alias_name="live",
+            version=self.chat_function.current_version,
+            provisioned_concurrent_executions=(
+                2 if self.node.try_get_context("production") else None
+            ),
+        )
+
+        self.chat_function_url = self.chat_alias.add_function_url(
             auth_type=_lambda.FunctionUrlAuthType.NONE,
             invoke_mode=_lambda.InvokeMode.RESPONSE_STREAM,
         )
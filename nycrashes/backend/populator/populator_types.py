@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-
 # Lambda data structures
 JsonObject = dict[str, object]
 LambdaEvent = JsonObject
@@ -11,6 +9,6 @@ LambdaContext = object
 LambdaResponse = JsonObject
 
 # SQL helpers
-SqlParameter = dict[str, object]
-SqlParameters = Iterable[SqlParameter]
-SqlResult = dict[str, object]
+SqlParameters = dict[str, object]
+SqlRow = tuple[object, ...]
+SqlResult = list[SqlRow]
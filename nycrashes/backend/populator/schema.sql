@@ -0,0 +1,207 @@
+-- Crash table definitions, applied by the populator in one call.
+-- Primary keys and indexes are created after the bulk load (see
+-- create_indexes in main.py), so none appear here. Autovacuum is
+-- disabled at creation so background ANALYZE/VACUUM never competes
+-- with the bulk load; create_indexes re-enables it after the final
+-- explicit ANALYZE.
+
+CREATE TABLE IF NOT EXISTS nyc_crashes (
+    -- Primary key is added after the bulk load (see create_indexes):
+    -- maintaining the B-tree row by row during the import turns a
+    -- sequential write into O(N log N) random I/O.
+    collision_id BIGINT,
+    crash_date TIMESTAMP WITHOUT TIME ZONE,
+    crash_time TEXT,
+    borough TEXT,
+    zip_code TEXT,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    location geometry(Point, 4326) GENERATED ALWAYS AS (
+        CASE
+            WHEN latitude IS NOT NULL AND longitude IS NOT NULL
+                THEN ST_Point(longitude, latitude, 4326)
+        END
+    ) STORED,
+    on_street_name TEXT,
+    off_street_name TEXT,
+    cross_street_name TEXT,
+    number_of_persons_injured INTEGER,
+    number_of_persons_killed INTEGER,
+    number_of_pedestrians_injured INTEGER,
+    number_of_pedestrians_killed INTEGER,
+    number_of_cyclist_injured INTEGER,
+    number_of_cyclist_killed INTEGER,
+    number_of_motorist_injured INTEGER,
+    number_of_motorist_killed INTEGER,
+    contributing_factor_vehicle_1 TEXT,
+    contributing_factor_vehicle_2 TEXT,
+    contributing_factor_vehicle_3 TEXT,
+    contributing_factor_vehicle_4 TEXT,
+    contributing_factor_vehicle_5 TEXT,
+    vehicle_type_code1 TEXT,
+    vehicle_type_code2 TEXT,
+    vehicle_type_code3 TEXT,
+    vehicle_type_code4 TEXT,
+    vehicle_type_code5 TEXT
+) WITH (autovacuum_enabled = false);
+
+CREATE TABLE IF NOT EXISTS ca_crashes (
+    -- Primary key is added after the bulk load (see create_indexes)
+    collision_id BIGINT,
+    report_number TEXT,
+    report_version INTEGER,
+    is_preliminary BOOLEAN,
+    ncic_code TEXT,
+    crash_date_time TIMESTAMP WITHOUT TIME ZONE,
+    crash_time_description TEXT,
+    beat TEXT,
+    city_id INTEGER,
+    city_code TEXT,
+    city_name TEXT,
+    county_code TEXT,
+    city_is_active BOOLEAN,
+    city_is_incorporated BOOLEAN,
+    collision_type_code TEXT,
+    collision_type_description TEXT,
+    collision_type_other_desc TEXT,
+    day_of_week TEXT,
+    dispatch_notified TEXT,
+    has_photographs BOOLEAN,
+    hit_run TEXT,
+    is_attachments_mailed BOOLEAN,
+    is_deleted BOOLEAN,
+    is_highway_related BOOLEAN,
+    is_tow_away BOOLEAN,
+    judicial_district TEXT,
+    motor_vehicle_involved_with_code TEXT,
+    motor_vehicle_involved_with_desc TEXT,
+    motor_vehicle_involved_with_other_desc TEXT,
+    number_injured INTEGER,
+    number_killed INTEGER,
+    weather_1 TEXT,
+    weather_2 TEXT,
+    road_condition_1 TEXT,
+    road_condition_2 TEXT,
+    special_condition TEXT,
+    lighting_code TEXT,
+    lighting_description TEXT,
+    latitude DOUBLE PRECISION,
+    longitude DOUBLE PRECISION,
+    location geometry(Point, 4326) GENERATED ALWAYS AS (
+        CASE
+            WHEN latitude IS NOT NULL AND longitude IS NOT NULL
+                THEN ST_Point(longitude, latitude, 4326)
+        END
+    ) STORED,
+    milepost_direction TEXT,
+    milepost_distance TEXT,
+    milepost_marker TEXT,
+    milepost_unit_of_measure TEXT,
+    pedestrian_action_code TEXT,
+    pedestrian_action_desc TEXT,
+    prepared_date TIMESTAMP WITHOUT TIME ZONE,
+    primary_collision_factor_code TEXT,
+    primary_collision_factor_violation TEXT,
+    primary_collision_factor_is_cited BOOLEAN,
+    primary_collision_party_number INTEGER,
+    primary_road TEXT,
+    reporting_district TEXT,
+    reporting_district_code TEXT,
+    reviewed_date TIMESTAMP WITHOUT TIME ZONE,
+    roadway_surface_code TEXT,
+    secondary_direction TEXT,
+    secondary_distance TEXT,
+    secondary_road TEXT,
+    secondary_unit_of_measure TEXT,
+    sketch_desc TEXT,
+    traffic_control_device_code TEXT,
+    created_date TIMESTAMP WITHOUT TIME ZONE,
+    modified_date TIMESTAMP WITHOUT TIME ZONE,
+    is_county_road BOOLEAN,
+    is_freeway BOOLEAN,
+    chp555_version TEXT,
+    is_additional_object_struck BOOLEAN,
+    notification_date TIMESTAMP WITHOUT TIME ZONE,
+    notification_time_description TEXT,
+    has_digital_media_files BOOLEAN,
+    evidence_number TEXT,
+    is_location_refer_to_narrative BOOLEAN,
+    is_aoi_one_same_as_location BOOLEAN
+) WITH (autovacuum_enabled = false);
+
+CREATE TABLE IF NOT EXISTS ca_injuredwitnesspassengers (
+    -- Primary key is added after the bulk load (see create_indexes)
+    injured_wit_pass_id BIGINT,
+    collision_id BIGINT,
+    stated_age INTEGER,
+    gender TEXT,
+    gender_desc TEXT,
+    race TEXT,
+    race_desc TEXT,
+    is_witness_only BOOLEAN,
+    is_passenger_only BOOLEAN,
+    extent_of_injury_code TEXT,
+    injured_person_type TEXT,
+    seat_position TEXT,
+    seat_position_other TEXT,
+    air_bag_code TEXT,
+    air_bag_description TEXT,
+    safety_equipment_code TEXT,
+    safety_equipment_description TEXT,
+    ejected TEXT,
+    is_vovc_notified BOOLEAN,
+    party_number INTEGER,
+    seat_position_description TEXT
+) WITH (autovacuum_enabled = false);
+
+CREATE TABLE IF NOT EXISTS ca_parties (
+    -- Primary key is added after the bulk load (see create_indexes)
+    party_id BIGINT,
+    collision_id BIGINT,
+    party_number INTEGER,
+    party_type TEXT,
+    is_at_fault BOOLEAN,
+    is_on_duty_emergency_vehicle BOOLEAN,
+    is_hit_and_run BOOLEAN,
+    airbag_code TEXT,
+    airbag_description TEXT,
+    safety_equipment_code TEXT,
+    safety_equipment_description TEXT,
+    special_information TEXT,
+    other_associate_factor TEXT,
+    inattention TEXT,
+    direction_of_travel TEXT,
+    street_or_highway_name TEXT,
+    speed_limit INTEGER,
+    movement_prec_coll_code TEXT,
+    movement_prec_coll_description TEXT,
+    sobriety_drug_physical_code1 TEXT,
+    sobriety_drug_physical_description1 TEXT,
+    sobriety_drug_physical_code2 TEXT,
+    sobriety_drug_physical_description2 TEXT,
+    gender_code TEXT,
+    gender_description TEXT,
+    stated_age INTEGER,
+    driver_license_class TEXT,
+    driver_license_state_code TEXT,
+    race_code TEXT,
+    race_desc TEXT,
+    vehicle1_type_id INTEGER,
+    vehicle1_type_desc TEXT,
+    vehicle1_year INTEGER,
+    vehicle1_make TEXT,
+    vehicle1_model TEXT,
+    vehicle1_color TEXT,
+    v1_is_vehicle_towed BOOLEAN,
+    vehicle2_type_id INTEGER,
+    vehicle2_type_desc TEXT,
+    vehicle2_year INTEGER,
+    vehicle2_make TEXT,
+    vehicle2_model TEXT,
+    vehicle2_color TEXT,
+    v2_is_vehicle_towed BOOLEAN,
+    lane TEXT,
+    thru_lanes INTEGER,
+    total_lanes INTEGER,
+    is_dre_conducted BOOLEAN
+) WITH (autovacuum_enabled = false);